@@ -0,0 +1,27 @@
+"""
+Todoアプリケーションの例外定義
+
+このモジュールはユースケース層・リポジトリ層から送出され、
+プレゼンテーション層でHTTPレスポンスに変換される例外を定義します。
+"""
+
+
+class TodoNotFoundError(ValueError):
+    """
+    指定されたIDのTodoアイテムが見つからない場合の例外
+
+    既存の呼び出し側との互換性のため、ValueErrorを継承しています。
+
+    Attributes:
+        todo_id (int): 見つからなかったTodoアイテムのID
+    """
+
+    def __init__(self, todo_id: int) -> None:
+        """
+        TodoNotFoundErrorを初期化します
+
+        Args:
+            todo_id: 見つからなかったTodoアイテムのID
+        """
+        self.todo_id = todo_id
+        super().__init__(f"Todo with id {todo_id} not found")
@@ -1,10 +1,77 @@
 import os
 from collections.abc import Generator
+from contextlib import ExitStack
 from functools import lru_cache
 
 from sqlalchemy import Engine
 from sqlmodel import Session, create_engine
 
+# コネクションプールの既定値（環境変数で上書き可能）
+DEFAULT_POOL_SIZE = 20
+DEFAULT_MAX_OVERFLOW = 20
+DEFAULT_POOL_TIMEOUT = 5
+DEFAULT_POOL_RECYCLE = 1800
+
+# SQLAlchemyのプール設定で「上限なし・無効」を表す値（max_overflow、pool_recycleで使用）
+POOL_SETTING_DISABLED = -1
+
+
+def _get_int_env(name: str, default: int, minimum: int = 0, disabled: int | None = None) -> int:
+    """整数値の環境変数を取得する。
+
+    環境変数が未設定または空文字列の場合は既定値を返します。
+
+    Args:
+        name (str): 環境変数名
+        default (int): 未設定時に使用する既定値
+        minimum (int): 許容する最小値（既定値: 0）
+        disabled (int | None): 最小値を下回っていても許容する、無効化を表す値（既定値: なし）
+
+    Returns:
+        int: 環境変数の値、または既定値
+
+    Raises:
+        ValueError: 環境変数の値が整数として解釈できない場合、または最小値を下回る場合
+    """
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        result = int(value)
+    except ValueError as e:
+        raise ValueError(f"Environment variable {name} must be an integer: {value!r}") from e
+    if result < minimum and result != disabled:
+        allowed = f">= {minimum}" if disabled is None else f">= {minimum} or {disabled}"
+        raise ValueError(f"Environment variable {name} must be an integer {allowed}: {value!r}")
+    return result
+
+
+def _get_pool_settings() -> dict[str, int]:
+    """環境変数からコネクションプールの設定値を取得する。
+
+    エンジンの作成とプールの上限の算出で同じ設定値を使用するため、読み取りはこの関数に集約します。
+
+    max_overflowとpool_recycleは、SQLAlchemyと同様に-1で上限なし・無効を指定できます。
+    pool_recycleの0は取得の度にコネクションを作り直す設定となり、
+    プールの意味がなくなるため拒否します。
+
+    Returns:
+        dict[str, int]: create_engine()に渡すコネクションプールの設定値
+
+    Raises:
+        ValueError: コネクションプールの設定値が整数でない・範囲外の場合
+    """
+    return {
+        "pool_size": _get_int_env("POSTGRES_POOL_SIZE", DEFAULT_POOL_SIZE, minimum=1),
+        "max_overflow": _get_int_env(
+            "POSTGRES_MAX_OVERFLOW", DEFAULT_MAX_OVERFLOW, disabled=POOL_SETTING_DISABLED
+        ),
+        "pool_timeout": _get_int_env("POSTGRES_POOL_TIMEOUT", DEFAULT_POOL_TIMEOUT),
+        "pool_recycle": _get_int_env(
+            "POSTGRES_POOL_RECYCLE", DEFAULT_POOL_RECYCLE, minimum=1, disabled=POOL_SETTING_DISABLED
+        ),
+    }
+
 
 @lru_cache
 def get_database_engine() -> Engine:
@@ -13,12 +80,22 @@ def get_database_engine() -> Engine:
     環境変数からデータベース接続情報を取得し、SQLAlchemyエンジンを作成します。
     @lru_cacheデコレータにより、一度作成されたエンジンは再利用されます。
 
+    ドライバにはpsycopg（v3）を使用します。同じSQLが繰り返し実行されると
+    サーバーサイドのプリペアドステートメントが自動的に使われ、解析・実行計画の作成が省略されます。
+
+    コネクションプールの設定は以下の環境変数で変更できます（未設定時は既定値）。
+    - POSTGRES_POOL_SIZE: 常時保持するコネクション数（1以上）
+    - POSTGRES_MAX_OVERFLOW: pool_sizeを超えて作成できるコネクション数（0以上、-1で上限なし）
+    - POSTGRES_POOL_TIMEOUT: コネクション取得の待機時間（秒、0以上）
+    - POSTGRES_POOL_RECYCLE: コネクションを再作成するまでの時間（秒、1以上、-1で再作成しない）
+
     Returns:
         Engine: SQLAlchemyのエンジンインスタンス
 
     Raises:
         KeyError: 必要な環境変数が設定されていない場合
-        ValueError: データベース接続文字列の構築に失敗した場合
+        ValueError: データベース接続文字列の構築に失敗した場合、
+            またはコネクションプールの設定値が整数でない・範囲外の場合
     """
     try:
         postgres_user = os.environ["POSTGRES_USER"]
@@ -32,8 +109,49 @@ def get_database_engine() -> Engine:
     if not all([postgres_user, postgres_password, postgres_server, postgres_port, postgres_db]):
         raise ValueError("One or more database environment variables are empty")
 
-    database_url = f"postgresql://{postgres_user}:{postgres_password}@{postgres_server}:{postgres_port}/{postgres_db}"
-    return create_engine(database_url)
+    database_url = f"postgresql+psycopg://{postgres_user}:{postgres_password}@{postgres_server}:{postgres_port}/{postgres_db}"
+    # 直近に使われたコネクションを優先して再利用し（LIFO）、
+    # 切断済みのコネクションは取得時に検出する（pre-ping）
+    return create_engine(
+        database_url,
+        **_get_pool_settings(),
+        pool_pre_ping=True,
+        pool_use_lifo=True,
+    )
+
+
+def get_connection_pool_capacity() -> int:
+    """コネクションプールが同時に払い出せるコネクションの最大数を取得する。
+
+    max_overflowが上限なし（-1）の場合は、同時に払い出せる数に上限がないため、
+    常時保持するpool_sizeを返します（スレッドプール側の同時実行数が実質的な上限となります）。
+
+    Returns:
+        int: pool_sizeとmax_overflowの合計（max_overflowが上限なしの場合はpool_size）
+
+    Raises:
+        ValueError: コネクションプールの設定値が整数でない・範囲外の場合
+    """
+    pool_settings = _get_pool_settings()
+    if pool_settings["max_overflow"] == POOL_SETTING_DISABLED:
+        return pool_settings["pool_size"]
+    return pool_settings["pool_size"] + pool_settings["max_overflow"]
+
+
+def warm_up_connection_pool() -> None:
+    """コネクションプールに事前にコネクションを確立する。
+
+    アプリケーション起動時に呼び出すことで、最初のリクエストで発生する
+    TCP接続・認証のコストを起動時に前倒しします。
+
+    Notes:
+        - 1本ずつ接続と返却を繰り返すと同じコネクションが再利用されるため、
+          pool_size分のコネクションを同時に取得してからまとめて返却します
+    """
+    engine = get_database_engine()
+    with ExitStack() as stack:
+        for _ in range(engine.pool.size()):
+            stack.enter_context(engine.connect())
 
 
 def get_session() -> Generator[Session, None, None]:
@@ -54,7 +172,9 @@ def get_session() -> Generator[Session, None, None]:
     Notes:
         - セッションは自動的にクローズされるため、手動でclose()を呼ぶ必要はありません
         - エラーが発生した場合も、with文によりセッションは適切にクローズされます
+        - コミット後も読み込み済みの属性を保持するため、expire_on_commit=Falseを指定しています
+          （コミット後の属性参照による再SELECTを防ぎます）
     """
     engine = get_database_engine()
-    with Session(engine) as session:
+    with Session(engine, expire_on_commit=False) as session:
         yield session
@@ -1,7 +1,49 @@
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
+from anyio import to_thread
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
+
+from app.infrastructure.db import (
+    get_connection_pool_capacity,
+    get_database_engine,
+    warm_up_connection_pool,
+)
 from app.routers import todo
+from app.routers.exception_handlers import register_exception_handlers
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    """
+    アプリケーションの起動・終了時の処理
+
+    起動時にコネクションプールへ事前に接続するため、データベースに接続できない場合は
+    最初のリクエストを待たずに起動が失敗します（接続時の例外がそのまま送出されます）。
+
+    Args:
+        app: 対象のFastAPIアプリケーション
+
+    Yields:
+        None: アプリケーションの稼働中
+    """
+    # 同期エンドポイントはスレッドプールで実行されるため、
+    # 同時実行数がコネクションプールの上限を下回らないようにする
+    limiter = to_thread.current_default_thread_limiter()
+    limiter.total_tokens = max(limiter.total_tokens, get_connection_pool_capacity())
+    # 起動時にコネクションプールを温めておく（ブロッキング処理のためスレッドで実行）
+    await run_in_threadpool(warm_up_connection_pool)
+    # OpenAPIスキーマは初回アクセス時に生成されるため、起動時に生成してキャッシュしておく
+    app.openapi()
+    yield
+    # 終了時にプール内のコネクションを解放する
+    get_database_engine().dispose()
+
+
+app = FastAPI(lifespan=lifespan)
 
-app = FastAPI()
+register_exception_handlers(app)
 
 app.include_router(todo.router)
 
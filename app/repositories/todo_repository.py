@@ -1,9 +1,51 @@
 from fastapi import Depends
+from sqlalchemy import delete, update
 from sqlmodel import Session, select
 
+from app.exceptions import TodoNotFoundError
 from app.infrastructure.db import get_session
 from app.models.todo import Todo, TodoCreate, TodoRead, TodoUpdate
 
+# 表示用モデルへ詰め替える際に参照するフィールド名
+_TODO_READ_FIELDS = tuple(TodoRead.model_fields)
+
+# 一覧取得用のSELECT文（ORMインスタンスを生成せず、必要な列のみを取得する）
+# パラメータを持たないため、リクエスト毎に組み立てずモジュール読み込み時に一度だけ構築する
+_SELECT_TODO_READ_COLUMNS = select(*(getattr(Todo, field) for field in _TODO_READ_FIELDS)).order_by(
+    Todo.id
+)
+
+
+def _to_todo_read(todo: Todo) -> TodoRead:
+    """
+    データベースから取得したTodoを表示用のモデルに変換します
+
+    DBの値はORMによって型付け済みのため、バリデーションを行わずにモデルを構築します。
+
+    Args:
+        todo: データベースから取得したTodoアイテム
+
+    Returns:
+        TodoRead: 表示用のTodoアイテム
+    """
+    return TodoRead.model_construct(**{field: getattr(todo, field) for field in _TODO_READ_FIELDS})
+
+
+def _raise_if_invalid_todo_id(todo_id: int) -> None:
+    """
+    存在し得ないIDが指定された場合は、データベースに問い合わせずに例外を発生させます
+
+    IDは1から自動採番されるため、0以下のIDのTodoアイテムは存在しません。
+
+    Args:
+        todo_id: 対象のTodoアイテムのID
+
+    Raises:
+        TodoNotFoundError: 0以下のIDが指定された場合
+    """
+    if todo_id <= 0:
+        raise TodoNotFoundError(todo_id)
+
 
 class TodoRepository:
     """
@@ -26,10 +68,15 @@ class TodoRepository:
         すべてのTodoアイテムを取得します
 
         Returns:
-            list[TodoRead]: すべてのTodoアイテムのリスト
+            list[TodoRead]: すべてのTodoアイテムのリスト（ID順）
         """
-        todos = self.session.exec(select(Todo)).all()
-        return [TodoRead.model_validate(todo) for todo in todos]
+        rows = self.session.exec(_SELECT_TODO_READ_COLUMNS).all()
+        result = [TodoRead.model_construct(**row._asdict()) for row in rows]
+
+        # 読み取り後すぐにトランザクションを終了し、コネクションをプールへ返却
+        self.session.commit()
+
+        return result
 
     def create_todo(self, todo: TodoCreate) -> TodoRead:
         """
@@ -45,12 +92,12 @@ class TodoRepository:
         new_todo = Todo.model_validate(todo)
 
         # データベースに保存
+        # 採番されたIDはINSERT時のRETURNINGで設定されるため、refreshは不要
         self.session.add(new_todo)
         self.session.commit()
-        self.session.refresh(new_todo)
 
         # 保存後のデータで表示用のモデルを返却
-        return TodoRead.model_validate(new_todo)
+        return _to_todo_read(new_todo)
 
     def _get_todo_by_id(self, todo_id: int) -> Todo:
         """
@@ -63,11 +110,13 @@ class TodoRepository:
             Todo: 指定されたTodoアイテム
 
         Raises:
-            ValueError: 指定されたIDのTodoアイテムが見つからない場合
+            TodoNotFoundError: 指定されたIDのTodoアイテムが見つからない場合
         """
+        _raise_if_invalid_todo_id(todo_id)
+
         todo = self.session.get(Todo, todo_id)
         if not todo:
-            raise ValueError(f"Todo with id {todo_id} not found")
+            raise TodoNotFoundError(todo_id)
         return todo
 
     def get_todo(self, todo_id: int) -> TodoRead:
@@ -81,10 +130,15 @@ class TodoRepository:
             TodoRead: 指定されたTodoアイテム
 
         Raises:
-            ValueError: 指定されたIDのTodoアイテムが見つからない場合
+            TodoNotFoundError: 指定されたIDのTodoアイテムが見つからない場合
         """
         todo = self._get_todo_by_id(todo_id)
-        return TodoRead.model_validate(todo)
+        result = _to_todo_read(todo)
+
+        # 読み取り後すぐにトランザクションを終了し、コネクションをプールへ返却
+        self.session.commit()
+
+        return result
 
     def update_todo(self, todo_id: int, todo: TodoUpdate) -> TodoRead:
         """
@@ -98,24 +152,28 @@ class TodoRepository:
             TodoRead: 更新されたTodoアイテム
 
         Raises:
-            ValueError: 指定されたIDのTodoアイテムが見つからない場合
+            TodoNotFoundError: 指定されたIDのTodoアイテムが見つからない場合
         """
-        # 対象データの取得
-        target = self._get_todo_by_id(todo_id)
-
         # 更新するデータの取得
         update_data = todo.model_dump(exclude_unset=True)
 
-        # 更新するデータを適用
-        target.sqlmodel_update(update_data)
+        # 更新内容がない場合は現在のデータをそのまま返却（IDの確認はget_todo()で行う）
+        if not update_data:
+            return self.get_todo(todo_id)
 
-        # データベースに保存
-        self.session.add(target)
+        _raise_if_invalid_todo_id(todo_id)
+
+        # UPDATE ... RETURNING により、更新と更新後データの取得を1往復で行う
+        statement = update(Todo).where(Todo.id == todo_id).values(**update_data).returning(Todo)
+        target = self.session.exec(statement).scalar_one_or_none()
+        if target is None:
+            raise TodoNotFoundError(todo_id)
+
+        # コミット前に表示用のモデルを作成し、コミット後の再読み込みを避ける
+        updated_todo = _to_todo_read(target)
         self.session.commit()
-        self.session.refresh(target)
 
-        # 更新後のデータで表示用のモデルを返却
-        return TodoRead.model_validate(target)
+        return updated_todo
 
     def delete_todo(self, todo_id: int) -> bool:
         """
@@ -128,13 +186,16 @@ class TodoRepository:
             bool: 削除が成功した場合True
 
         Raises:
-            ValueError: 指定されたIDのTodoアイテムが見つからない場合
+            TodoNotFoundError: 指定されたIDのTodoアイテムが見つからない場合
         """
-        # 対象データの取得
-        todo = self._get_todo_by_id(todo_id)
+        _raise_if_invalid_todo_id(todo_id)
+
+        # DELETE ... RETURNING により、存在確認と削除を1往復で行う
+        statement = delete(Todo).where(Todo.id == todo_id).returning(Todo.id)
+        deleted_id = self.session.exec(statement).scalar_one_or_none()
+        if deleted_id is None:
+            raise TodoNotFoundError(todo_id)
 
-        # データベースから削除
-        self.session.delete(todo)
         self.session.commit()
 
         return True
@@ -0,0 +1,56 @@
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import IntegrityError
+
+from app.exceptions import TodoNotFoundError
+
+# IntegrityErrorのメッセージに使用する、HTTPメソッドごとの操作名
+_INTEGRITY_ERROR_ACTIONS = {"POST": "create", "PUT": "update", "DELETE": "delete"}
+
+
+async def todo_not_found_handler(request: Request, exc: Exception) -> JSONResponse:
+    """
+    TodoNotFoundErrorを404レスポンスに変換する
+
+    Args:
+        request: 例外が発生したリクエスト
+        exc: 発生したTodoNotFoundError
+
+    Returns:
+        JSONResponse: 例外のメッセージをdetailに設定した404レスポンス
+    """
+    return JSONResponse(status_code=404, content={"detail": str(exc)})
+
+
+async def integrity_error_handler(request: Request, exc: Exception) -> JSONResponse:
+    """
+    IntegrityErrorを400レスポンスに変換する
+
+    メッセージ中の操作名はHTTPメソッドから決定します（POST: create、PUT: update、DELETE: delete）。
+    それ以外のメソッドでは操作名をprocessとします。
+
+    Args:
+        request: 例外が発生したリクエスト
+        exc: 発生したIntegrityError
+
+    Returns:
+        JSONResponse: データ制約違反を示すメッセージをdetailに設定した400レスポンス
+    """
+    action = _INTEGRITY_ERROR_ACTIONS.get(request.method, "process")
+    return JSONResponse(
+        status_code=400,
+        content={"detail": f"Failed to {action} todo due to data constraint violation"},
+    )
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """
+    アプリケーションに例外ハンドラを登録する
+
+    各エンドポイントでtry/exceptを記述せず、例外からHTTPレスポンスへの変換を一箇所で行います。
+
+    Args:
+        app: 例外ハンドラを登録するFastAPIアプリケーション
+    """
+    app.add_exception_handler(TodoNotFoundError, todo_not_found_handler)
+    app.add_exception_handler(IntegrityError, integrity_error_handler)
@@ -1,53 +1,45 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.exc import IntegrityError
+from fastapi import APIRouter, Depends, Response
+from pydantic import TypeAdapter
 
 from app.models.todo import TodoCreate, TodoRead, TodoUpdate
 from app.usecases.todo_usecase import TodoUsecase
 
 router = APIRouter(prefix="/todos", tags=["todos"])
 
+# 一覧レスポンスをpydantic-coreで直接JSONへシリアライズするためのアダプタ
+_TODO_LIST_ADAPTER = TypeAdapter(list[TodoRead])
+
+
+def _to_json_response(todo: TodoRead) -> Response:
+    """TodoReadをresponse_modelによる再検証を経由せずにJSONレスポンスへ変換する"""
+    return Response(content=todo.model_dump_json(), media_type="application/json")
+
 
 # ruff: noqa
 @router.get("/", response_model=list[TodoRead])
-def get_todos(todo_usecase: TodoUsecase = Depends()) -> list[TodoRead]:
-    return todo_usecase.get_todos()
+def get_todos(todo_usecase: TodoUsecase = Depends()) -> Response:
+    # response_modelによる再検証とjsonable_encoderを経由せずにJSONを生成する
+    todos = todo_usecase.get_todos()
+    return Response(content=_TODO_LIST_ADAPTER.dump_json(todos), media_type="application/json")
 
 
 @router.get("/{todo_id}", response_model=TodoRead)
-def get_todo(todo_id: int, todo_usecase: TodoUsecase = Depends()) -> TodoRead:
-    try:
-        return todo_usecase.get_todo(todo_id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+def get_todo(todo_id: int, todo_usecase: TodoUsecase = Depends()) -> Response:
+    return _to_json_response(todo_usecase.get_todo(todo_id))
 
 
 @router.post("/", response_model=TodoRead)
-def create_todo(todo_create: TodoCreate, todo_usecase: TodoUsecase = Depends()) -> TodoRead:
-    try:
-        return todo_usecase.create_todo(todo_create)
-    except IntegrityError as e:
-        raise HTTPException(
-            status_code=400, detail="Failed to create todo due to data constraint violation"
-        )
+def create_todo(todo_create: TodoCreate, todo_usecase: TodoUsecase = Depends()) -> Response:
+    return _to_json_response(todo_usecase.create_todo(todo_create))
 
 
 @router.put("/{todo_id}", response_model=TodoRead)
 def update_todo(
     todo_id: int, todo_update: TodoUpdate, todo_usecase: TodoUsecase = Depends()
-) -> TodoRead:
-    try:
-        return todo_usecase.update_todo(todo_id, todo_update)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-    except IntegrityError as e:
-        raise HTTPException(
-            status_code=400, detail="Failed to update todo due to data constraint violation"
-        )
+) -> Response:
+    return _to_json_response(todo_usecase.update_todo(todo_id, todo_update))
 
 
 @router.delete("/{todo_id}", response_model=bool)
 def delete_todo(todo_id: int, todo_usecase: TodoUsecase = Depends()) -> bool:
-    try:
-        return todo_usecase.delete_todo(todo_id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+    return todo_usecase.delete_todo(todo_id)
@@ -1,12 +1,14 @@
 import os
 from collections.abc import Generator
-from typing import Any
 
 import pytest
 from pytest_postgresql import factories
-from sqlalchemy import Engine
+from pytest_postgresql.executor_noop import NoopExecutor
+from pytest_postgresql.janitor import DatabaseJanitor
+from sqlalchemy import Engine, insert
 from sqlmodel import Session, SQLModel, create_engine
 
+from app.infrastructure.db import get_database_engine
 from app.models.todo import Todo
 
 # 環境変数を取得
@@ -16,48 +18,93 @@ postgres_server = os.environ["POSTGRES_SERVER"]
 postgres_port = os.environ["POSTGRES_PORT"]
 postgres_db = os.environ["POSTGRES_DB"]
 
-# ライブラリを使ってテスト用のDBをセットアップするためのfixtureを作成
-# 既定ではdbname=testでDBが作成されテストケースの実行毎にDBは削除され１から再作成される
+# ライブラリを使って既存のPostgreSQLサーバーに接続するためのfixtureを作成
 postgresql_noproc = factories.postgresql_noproc(
     user=postgres_user,
     password=postgres_password,
     host=postgres_server,
     port=postgres_port,
 )
-postgresql_fixture = factories.postgresql(
-    "postgresql_noproc",
-)
 
 
-@pytest.fixture
-def get_test_engine(postgresql_fixture: Any) -> Engine:
-    """テスト用のEngineを取得するFixture"""
-    # 接続URIを作成
-    uri = (
-        f"postgresql://"
-        f"{postgresql_fixture.info.user}:{postgresql_fixture.info.password}@{postgresql_fixture.info.host}:{postgresql_fixture.info.port}"
-        f"/{postgresql_fixture.info.dbname}"
+@pytest.fixture(autouse=True)
+def clear_cached_resources() -> Generator[None, None, None]:
+    """
+    キャッシュされた状態がテスト間で持ち越されないようにするFixture
+
+    各テストの実行前と実行後にキャッシュをクリアします。
+    lru_cacheでメモ化する関数を追加した場合は、ここでcache_clear()を呼び出してください。
+    なお、FastAPIの依存性の上書きはアプリケーションを作成するFixture側で元に戻しています。
+    """
+    get_database_engine.cache_clear()
+
+    yield
+
+    get_database_engine.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def get_test_engine(postgresql_noproc: NoopExecutor) -> Generator[Engine, None, None]:
+    """
+    テスト用のEngineを取得するFixture
+
+    テスト用のDBとテーブルはテストセッション全体で一度だけ作成し、終了時に削除します。
+    """
+    janitor = DatabaseJanitor(
+        user=postgresql_noproc.user,
+        host=postgresql_noproc.host,
+        port=postgresql_noproc.port,
+        version=postgresql_noproc.version,
+        dbname=postgresql_noproc.dbname,
+        password=postgresql_noproc.password,
     )
-    return create_engine(uri)
+    with janitor:
+        # 接続URIを作成（アプリケーションと同じくpsycopg（v3）ドライバを使用する）
+        uri = (
+            f"postgresql+psycopg://"
+            f"{postgresql_noproc.user}:{postgresql_noproc.password}@{postgresql_noproc.host}:{postgresql_noproc.port}"
+            f"/{postgresql_noproc.dbname}"
+        )
+        # テスト用のDBは使い捨てのため、コミット時にWALのディスク書き込みを待たないようにする
+        engine = create_engine(uri, connect_args={"options": "-c synchronous_commit=off"})
+
+        # テーブルを作成する
+        SQLModel.metadata.create_all(engine)
+
+        yield engine
+
+        # DB削除前にプール内のコネクションを解放する
+        engine.dispose()
 
 
 @pytest.fixture
 def get_test_session(get_test_engine: Engine) -> Generator[Session, None, None]:
     """テスト用のSessionを取得するFixture"""
-    # テーブルを作成する
-    SQLModel.metadata.create_all(get_test_engine)
+    # テストケース毎にDBを作り直す代わりに、全テーブルを空にしてIDの採番をリセットする
+    table_names = ", ".join(table.name for table in SQLModel.metadata.sorted_tables)
+    with get_test_engine.begin() as connection:
+        connection.exec_driver_sql(f"TRUNCATE TABLE {table_names} RESTART IDENTITY")
 
-    with Session(get_test_engine) as session:
+    # アプリケーションのget_sessionと同じく、コミット後も属性を保持する
+    with Session(get_test_engine, expire_on_commit=False) as session:
         yield session
 
 
 @pytest.fixture
 def create_test_todo_data(get_test_session: Session, request: pytest.FixtureRequest) -> list[Todo]:
     """テスト用のTodoデータを作成するFixture"""
-    todos = [Todo.model_validate(t) for t in request.param]
-    for todo in todos:
-        get_test_session.add(todo)
-        get_test_session.commit()
-        get_test_session.refresh(todo)
+    # 登録データがない場合はINSERTを発行しない（空のパラメータでは実行できないため）
+    if not request.param:
+        return []
+
+    # モデルを1件ずつ生成・追加せず、複数行のINSERTでまとめて登録する
+    # 採番されたIDはRETURNINGで取得し、登録データの順序で返却する
+    todos = list(
+        get_test_session.scalars(
+            insert(Todo).returning(Todo, sort_by_parameter_order=True),
+            [t.model_dump() for t in request.param],
+        )
+    )
+    get_test_session.commit()
 
     return todos
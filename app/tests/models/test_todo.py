@@ -7,9 +7,16 @@ from app.models.todo import Todo, TodoBase, TodoCreate, TodoRead, TodoUpdate
 
 
 class TestTodoBaseSuccessCases:
-    """TodoBaseクラスの正常ケースのテスト"""
+    """TodoBaseクラスと、同じフィールドを持つTodoCreateの正常ケースのテスト"""
 
-    # TodoBase作成時の正常ケース
+    # TodoBase・TodoCreate作成時の正常ケース
+    @pytest.mark.parametrize(
+        "model_cls",
+        [
+            pytest.param(TodoBase, id="todo_base"),
+            pytest.param(TodoCreate, id="todo_create"),
+        ],
+    )
     @pytest.mark.parametrize(
         "args, expected",
         [
@@ -20,11 +27,11 @@ class TestTodoBaseSuccessCases:
                     "description": "test description1",
                     "completed": False,
                 },
-                TodoBase(
-                    title="test title1",
-                    description="test description1",
-                    completed=False,
-                ),
+                {
+                    "title": "test title1",
+                    "description": "test description1",
+                    "completed": False,
+                },
                 id="valid_todo_base_no_completed",
             ),
             # completedがTrue
@@ -34,11 +41,11 @@ class TestTodoBaseSuccessCases:
                     "description": "test description2",
                     "completed": True,
                 },
-                TodoBase(
-                    title="test title2",
-                    description="test description2",
-                    completed=True,
-                ),
+                {
+                    "title": "test title2",
+                    "description": "test description2",
+                    "completed": True,
+                },
                 id="valid_todo_base_completed",
             ),
             # completedがデフォルト値
@@ -47,20 +54,22 @@ class TestTodoBaseSuccessCases:
                     "title": "test title3",
                     "description": "test description3",
                 },
-                TodoBase(
-                    title="test title3",
-                    description="test description3",
-                    completed=False,
-                ),
+                {
+                    "title": "test title3",
+                    "description": "test description3",
+                    "completed": False,
+                },
                 id="valid_todo_base_default_completed",
             ),
         ],
     )
-    def test_valid_todo_base(self, args: dict[str, Any], expected: TodoBase) -> None:
-        """有効なTodoBaseの作成をテスト"""
-        todo_base = TodoBase(**args)
+    def test_valid_todo_base(
+        self, model_cls: type[TodoBase], args: dict[str, Any], expected: dict[str, Any]
+    ) -> None:
+        """有効なTodoBase・TodoCreateの作成をテスト"""
+        todo_base = model_cls(**args)
 
-        assert todo_base == expected
+        assert todo_base.model_dump() == expected
 
 
 class TestTodoSuccessCases:
@@ -78,12 +87,12 @@ class TestTodoSuccessCases:
                     "description": "test description",
                     "completed": False,
                 },
-                Todo(
-                    id=1,
-                    title="test title",
-                    description="test description",
-                    completed=False,
-                ),
+                {
+                    "id": 1,
+                    "title": "test title",
+                    "description": "test description",
+                    "completed": False,
+                },
                 id="valid_todo_with_id",
             ),
             # IDを指定しないTodoの作成
@@ -93,12 +102,12 @@ class TestTodoSuccessCases:
                     "description": "test description",
                     "completed": True,
                 },
-                Todo(
-                    id=None,
-                    title="test title",
-                    description="test description",
-                    completed=True,
-                ),
+                {
+                    "id": None,
+                    "title": "test title",
+                    "description": "test description",
+                    "completed": True,
+                },
                 id="valid_todo_without_id",
             ),
             # IDを指定しないTodoの作成（completedがデフォルト値）
@@ -107,63 +116,21 @@ class TestTodoSuccessCases:
                     "title": "test title",
                     "description": "test description",
                 },
-                Todo(
-                    id=None,
-                    title="test title",
-                    description="test description",
-                    completed=False,
-                ),
-                id="valid_todo_without_id_and_completed",
-            ),
-        ],
-    )
-    def test_valid_todo(self, args: dict[str, Any], expected: Todo) -> None:
-        """有効なTodoの作成をテスト"""
-        todo = Todo(**args)
-
-        assert todo == expected
-
-
-class TestTodoCreateSuccessCases:
-    """TodoCreateの正常ケースのテスト"""
-
-    # TodoCreate作成時の正常ケース
-    @pytest.mark.parametrize(
-        "args, expected",
-        [
-            pytest.param(
                 {
-                    "title": "test title1",
-                    "description": "test description1",
+                    "id": None,
+                    "title": "test title",
+                    "description": "test description",
                     "completed": False,
                 },
-                TodoCreate(title="test title1", description="test description1", completed=False),
-                id="valid_todo_create_no_completed",
-            ),
-            pytest.param(
-                {
-                    "title": "test title2",
-                    "description": "test description2",
-                    "completed": True,
-                },
-                TodoCreate(title="test title2", description="test description2", completed=True),
-                id="valid_todo_create_completed",
-            ),
-            pytest.param(
-                {
-                    "title": "test title3",
-                    "description": "test description3",
-                },
-                TodoCreate(title="test title3", description="test description3", completed=False),
-                id="valid_todo_create_default_completed",
+                id="valid_todo_without_id_and_completed",
             ),
         ],
     )
-    def test_valid_todo_create(self, args: dict[str, Any], expected: TodoCreate) -> None:
-        """有効なTodoCreateの作成をテスト"""
-        todo_create = TodoCreate(**args)
+    def test_valid_todo(self, args: dict[str, Any], expected: dict[str, Any]) -> None:
+        """有効なTodoの作成をテスト"""
+        todo = Todo(**args)
 
-        assert todo_create == expected
+        assert todo.model_dump() == expected
 
 
 class TestTodoCreate_ErrorCases:
@@ -240,12 +207,12 @@ class TestTodoReadSuccessCases:
                     "description": "test description",
                     "completed": False,
                 },
-                TodoRead(
-                    id=1,
-                    title="test title",
-                    description="test description",
-                    completed=False,
-                ),
+                {
+                    "id": 1,
+                    "title": "test title",
+                    "description": "test description",
+                    "completed": False,
+                },
                 id="valid_todo_read_no_completed",
             ),
             # completedがTrueのTodoReadの作成
@@ -256,12 +223,12 @@ class TestTodoReadSuccessCases:
                     "description": "test description",
                     "completed": True,
                 },
-                TodoRead(
-                    id=1,
-                    title="test title",
-                    description="test description",
-                    completed=True,
-                ),
+                {
+                    "id": 1,
+                    "title": "test title",
+                    "description": "test description",
+                    "completed": True,
+                },
                 id="valid_todo_read_completed",
             ),
             # completedがデフォルト値のTodoReadの作成
@@ -271,21 +238,21 @@ class TestTodoReadSuccessCases:
                     "title": "test title",
                     "description": "test description",
                 },
-                TodoRead(
-                    id=1,
-                    title="test title",
-                    description="test description",
-                    completed=False,
-                ),
+                {
+                    "id": 1,
+                    "title": "test title",
+                    "description": "test description",
+                    "completed": False,
+                },
                 id="valid_todo_read_default_completed",
             ),
         ],
     )
-    def test_valid_todo_read(self, args: dict[str, Any], expected: TodoRead) -> None:
+    def test_valid_todo_read(self, args: dict[str, Any], expected: dict[str, Any]) -> None:
         """有効なTodoReadの作成をテスト"""
         todo_read = TodoRead(**args)
 
-        assert todo_read == expected
+        assert todo_read.model_dump() == expected
 
 
 class TestTodoUpdateSuccessCases:
@@ -293,14 +260,13 @@ class TestTodoUpdateSuccessCases:
 
     # TodoUpdate作成時の正常ケース
     @pytest.mark.parametrize(
-        "args, expected",
+        "args",
         [
             # タイトルのみの更新
             pytest.param(
                 {
                     "title": "updated title",
                 },
-                TodoUpdate(title="updated title"),
                 id="valid_todo_update_title_only",
             ),
             # 説明のみの更新
@@ -308,7 +274,6 @@ class TestTodoUpdateSuccessCases:
                 {
                     "description": "updated description",
                 },
-                TodoUpdate(description="updated description"),
                 id="valid_todo_update_description_only",
             ),
             # 完了状態のみの更新
@@ -316,7 +281,6 @@ class TestTodoUpdateSuccessCases:
                 {
                     "completed": True,
                 },
-                TodoUpdate(completed=True),
                 id="valid_todo_update_completed",
             ),
             # 全フィールドの更新
@@ -326,24 +290,25 @@ class TestTodoUpdateSuccessCases:
                     "description": "updated description",
                     "completed": True,
                 },
-                TodoUpdate(
-                    title="updated title", description="updated description", completed=True
-                ),
                 id="valid_todo_update_all_fields",
             ),
             # 更新対象なし
             pytest.param(
                 {},
-                TodoUpdate(),
                 id="valid_todo_update_no_fields",
             ),
         ],
     )
-    def test_valid_todo_update(self, args: dict[str, Any], expected: TodoUpdate) -> None:
-        """有効なTodoUpdateの作成をテスト"""
+    def test_valid_todo_update(self, args: dict[str, Any]) -> None:
+        """
+        有効なTodoUpdateの作成をテスト
+
+        更新処理では指定されたフィールドのみを使用するため、
+        未指定のフィールドを除いた値が入力と一致することを検証します。
+        """
         todo_update = TodoUpdate(**args)
 
-        assert todo_update == expected
+        assert todo_update.model_dump(exclude_unset=True) == args
 
 
 class TestTodoUpdateErrorCases:
@@ -1,12 +1,26 @@
+from collections.abc import Callable
 from typing import ClassVar
 
 import pytest
 from _pytest.mark import ParameterSet
+from pytest_mock import MockerFixture
 from sqlmodel import Session
 
+from app.exceptions import TodoNotFoundError
 from app.models.todo import Todo, TodoCreate, TodoRead, TodoUpdate
 from app.repositories.todo_repository import TodoRepository
 
+# 複数のテストケースで使用する登録用データ。ケース毎に生成せず共通のインスタンスを参照する
+TODO_CREATE_TEST = TodoCreate(title="test", description="test", completed=False)
+TODO_CREATE_TEST2 = TodoCreate(title="test2", description="test2", completed=False)
+
+
+@pytest.fixture
+def repository(get_test_session: Session) -> TodoRepository:
+    """テスト用のセッションを使用するリポジトリを作成するFixture"""
+    return TodoRepository(get_test_session)
+
+
 # =============================================================================
 # 正常ケースのテスト
 # =============================================================================
@@ -27,21 +41,36 @@ class TestTodoRepositorySuccessCases:
             ),
             # 登録が1件
             pytest.param(
-                [TodoCreate(title="test", description="test", completed=False)],
-                [TodoRead(id=1, title="test", description="test", completed=False)],
+                [TODO_CREATE_TEST],
+                [TodoRead.model_construct(id=1, title="test", description="test", completed=False)],
                 id="one_todo",
             ),
             # 登録が複数件
             pytest.param(
                 [
-                    TodoCreate(title="test", description="test", completed=False),
-                    TodoCreate(title="test2", description="test2", completed=False),
+                    TODO_CREATE_TEST,
+                    TODO_CREATE_TEST2,
                     TodoCreate(title="test3", description="test3", completed=True),
                 ],
                 [
-                    TodoRead(id=1, title="test", description="test", completed=False),
-                    TodoRead(id=2, title="test2", description="test2", completed=False),
-                    TodoRead(id=3, title="test3", description="test3", completed=True),
+                    TodoRead.model_construct(
+                        id=1,
+                        title="test",
+                        description="test",
+                        completed=False,
+                    ),
+                    TodoRead.model_construct(
+                        id=2,
+                        title="test2",
+                        description="test2",
+                        completed=False,
+                    ),
+                    TodoRead.model_construct(
+                        id=3,
+                        title="test3",
+                        description="test3",
+                        completed=True,
+                    ),
                 ],
                 id="multiple_todos",
             ),
@@ -50,14 +79,11 @@ class TestTodoRepositorySuccessCases:
     )
     def test_get_all_todos_success_cases(
         self,
-        get_test_session: Session,
+        repository: TodoRepository,
         create_test_todo_data: list[Todo],
         expected_todos: list[TodoRead],
     ) -> None:
         """get_all_todos()をテスト"""
-        # リポジトリを作成
-        repository = TodoRepository(get_test_session)
-
         # メソッドを実行
         todos = repository.get_all_todos()
 
@@ -71,32 +97,29 @@ class TestTodoRepositorySuccessCases:
         "todo_create, expected_todo",
         [
             pytest.param(
-                TodoCreate(title="test", description="test", completed=False),
-                TodoRead(id=1, title="test", description="test", completed=False),
+                TODO_CREATE_TEST,
+                TodoRead.model_construct(id=1, title="test", description="test", completed=False),
                 id="create_todo",
             ),
             pytest.param(
                 TodoCreate(title="test2", description="test2", completed=True),
-                TodoRead(id=1, title="test2", description="test2", completed=True),
+                TodoRead.model_construct(id=1, title="test2", description="test2", completed=True),
                 id="create_todo_completed",
             ),
             pytest.param(
                 TodoCreate(title="test3", description="test3"),
-                TodoRead(id=1, title="test3", description="test3", completed=False),
+                TodoRead.model_construct(id=1, title="test3", description="test3", completed=False),
                 id="create_todo_default_completed",
             ),
         ],
     )
     def test_create_todo_success_cases(
         self,
-        get_test_session: Session,
+        repository: TodoRepository,
         todo_create: TodoCreate,
         expected_todo: TodoRead,
     ) -> None:
         """create_todo()をテスト"""
-        # リポジトリを作成
-        repository = TodoRepository(get_test_session)
-
         # メソッドを実行
         todo = repository.create_todo(todo_create)
 
@@ -111,15 +134,15 @@ class TestTodoRepositorySuccessCases:
         [
             pytest.param(
                 1,
-                [TodoCreate(title="test", description="test", completed=False)],
+                [TODO_CREATE_TEST],
                 Todo(id=1, title="test", description="test", completed=False),
                 id="get_todo_in_single_todo",
             ),
             pytest.param(
                 2,
                 [
-                    TodoCreate(title="test", description="test", completed=False),
-                    TodoCreate(title="test2", description="test2", completed=False),
+                    TODO_CREATE_TEST,
+                    TODO_CREATE_TEST2,
                 ],
                 Todo(id=2, title="test2", description="test2", completed=False),
                 id="get_todo_in_multiple_todos",
@@ -129,15 +152,12 @@ class TestTodoRepositorySuccessCases:
     )
     def test_get_todo_by_id_success_cases(
         self,
-        get_test_session: Session,
+        repository: TodoRepository,
         todo_id: int,
         create_test_todo_data: list[Todo],
         expected_todo: Todo,
     ) -> None:
         """_get_todo_by_id()をテスト"""
-        # リポジトリを作成
-        repository = TodoRepository(get_test_session)
-
         # メソッドを実行
         todo = repository._get_todo_by_id(todo_id)
 
@@ -152,17 +172,17 @@ class TestTodoRepositorySuccessCases:
         [
             pytest.param(
                 1,
-                [TodoCreate(title="test", description="test", completed=False)],
-                TodoRead(id=1, title="test", description="test", completed=False),
+                [TODO_CREATE_TEST],
+                TodoRead.model_construct(id=1, title="test", description="test", completed=False),
                 id="get_todo_in_single_todo",
             ),
             pytest.param(
                 2,
                 [
-                    TodoCreate(title="test", description="test", completed=False),
-                    TodoCreate(title="test2", description="test2", completed=False),
+                    TODO_CREATE_TEST,
+                    TODO_CREATE_TEST2,
                 ],
-                TodoRead(id=2, title="test2", description="test2", completed=False),
+                TodoRead.model_construct(id=2, title="test2", description="test2", completed=False),
                 id="get_todo_in_multiple_todos",
             ),
         ],
@@ -170,15 +190,12 @@ class TestTodoRepositorySuccessCases:
     )
     def test_get_todo_success_cases(
         self,
-        get_test_session: Session,
+        repository: TodoRepository,
         todo_id: int,
         create_test_todo_data: list[Todo],
         expected_todo: TodoRead,
     ) -> None:
         """get_todo()をテスト"""
-        # リポジトリを作成
-        repository = TodoRepository(get_test_session)
-
         # メソッドを実行
         todo = repository.get_todo(todo_id)
 
@@ -194,68 +211,96 @@ class TestTodoRepositorySuccessCases:
             # タイトルのみ更新
             pytest.param(
                 1,
-                [TodoCreate(title="test", description="test", completed=False)],
+                [TODO_CREATE_TEST],
                 TodoUpdate(title="updated"),
-                TodoRead(id=1, title="updated", description="test", completed=False),
+                TodoRead.model_construct(
+                    id=1,
+                    title="updated",
+                    description="test",
+                    completed=False,
+                ),
                 id="update_todo_title",
             ),
             # 説明のみ更新
             pytest.param(
                 1,
-                [TodoCreate(title="test", description="test", completed=False)],
+                [TODO_CREATE_TEST],
                 TodoUpdate(description="updated"),
-                TodoRead(id=1, title="test", description="updated", completed=False),
+                TodoRead.model_construct(
+                    id=1,
+                    title="test",
+                    description="updated",
+                    completed=False,
+                ),
                 id="update_todo_description",
             ),
             # 完了状態のみ更新
             pytest.param(
                 1,
-                [TodoCreate(title="test", description="test", completed=False)],
+                [TODO_CREATE_TEST],
                 TodoUpdate(completed=True),
-                TodoRead(id=1, title="test", description="test", completed=True),
+                TodoRead.model_construct(id=1, title="test", description="test", completed=True),
                 id="update_todo_completed",
             ),
             # タイトルと完了状態のみ更新
             pytest.param(
                 1,
-                [TodoCreate(title="test", description="test", completed=False)],
+                [TODO_CREATE_TEST],
                 TodoUpdate(title="updated", completed=True),
-                TodoRead(id=1, title="updated", description="test", completed=True),
+                TodoRead.model_construct(id=1, title="updated", description="test", completed=True),
                 id="update_todo_title_and_completed",
             ),
             # タイトルと説明のみ更新
             pytest.param(
                 1,
-                [TodoCreate(title="test", description="test", completed=False)],
+                [TODO_CREATE_TEST],
                 TodoUpdate(title="updated", description="updated"),
-                TodoRead(id=1, title="updated", description="updated", completed=False),
+                TodoRead.model_construct(
+                    id=1,
+                    title="updated",
+                    description="updated",
+                    completed=False,
+                ),
                 id="update_todo_title_and_description",
             ),
             # 説明と完了状態のみ更新
             pytest.param(
                 1,
-                [TodoCreate(title="test", description="test", completed=False)],
+                [TODO_CREATE_TEST],
                 TodoUpdate(description="updated", completed=True),
-                TodoRead(id=1, title="test", description="updated", completed=True),
+                TodoRead.model_construct(id=1, title="test", description="updated", completed=True),
                 id="update_todo_description_and_completed",
             ),
             # すべて更新
             pytest.param(
                 1,
-                [TodoCreate(title="test", description="test", completed=False)],
+                [TODO_CREATE_TEST],
                 TodoUpdate(title="updated", description="updated", completed=True),
-                TodoRead(id=1, title="updated", description="updated", completed=True),
+                TodoRead.model_construct(
+                    id=1,
+                    title="updated",
+                    description="updated",
+                    completed=True,
+                ),
                 id="update_todo_all",
             ),
+            # 更新内容なし
+            pytest.param(
+                1,
+                [TODO_CREATE_TEST],
+                TodoUpdate(),
+                TodoRead.model_construct(id=1, title="test", description="test", completed=False),
+                id="update_todo_no_fields",
+            ),
             # 複数件ある内の１つの更新
             pytest.param(
                 2,
                 [
-                    TodoCreate(title="test", description="test", completed=False),
-                    TodoCreate(title="test2", description="test2", completed=False),
+                    TODO_CREATE_TEST,
+                    TODO_CREATE_TEST2,
                 ],
                 TodoUpdate(completed=True),
-                TodoRead(id=2, title="test2", description="test2", completed=True),
+                TodoRead.model_construct(id=2, title="test2", description="test2", completed=True),
                 id="update_todo_multiple_one",
             ),
         ],
@@ -263,16 +308,13 @@ class TestTodoRepositorySuccessCases:
     )
     def test_update_todo_success_cases(
         self,
-        get_test_session: Session,
+        repository: TodoRepository,
         todo_id: int,
         create_test_todo_data: list[Todo],
         todo_update: TodoUpdate,
         expected_todo: TodoRead,
     ) -> None:
         """update_todo()をテスト"""
-        # リポジトリを作成
-        repository = TodoRepository(get_test_session)
-
         # メソッドを実行
         todo = repository.update_todo(todo_id, todo_update)
 
@@ -287,14 +329,14 @@ class TestTodoRepositorySuccessCases:
         [
             pytest.param(
                 1,
-                [TodoCreate(title="test", description="test", completed=False)],
+                [TODO_CREATE_TEST],
                 id="delete_todo_in_single_todo",
             ),
             pytest.param(
                 2,
                 [
-                    TodoCreate(title="test", description="test", completed=False),
-                    TodoCreate(title="test2", description="test2", completed=False),
+                    TODO_CREATE_TEST,
+                    TODO_CREATE_TEST2,
                 ],
                 id="delete_todo_in_multiple_todos",
             ),
@@ -303,14 +345,12 @@ class TestTodoRepositorySuccessCases:
     )
     def test_delete_todo_success_cases(
         self,
+        repository: TodoRepository,
         get_test_session: Session,
         todo_id: int,
         create_test_todo_data: list[Todo],
     ) -> None:
         """delete_todo()をテスト"""
-        # リポジトリを作成
-        repository = TodoRepository(get_test_session)
-
         # メソッドを実行
         result = repository.delete_todo(todo_id)
 
@@ -318,8 +358,8 @@ class TestTodoRepositorySuccessCases:
         assert result is True
 
         # 削除の検証：対象のTodoが実際に削除されていることを確認
-        with pytest.raises(ValueError):
-            repository.get_todo(todo_id)
+        # リポジトリの例外処理を経由せず、セッションから直接取得して存在しないことを確認する
+        assert get_test_session.get(Todo, todo_id) is None
 
 
 # =============================================================================
@@ -337,68 +377,71 @@ class TestTodoRepositoryErrorCases:
         pytest.param(-1, "Todo with id -1 not found", id="negative_id"),
     ]
 
-    # =============================================================================
-    # _get_todo_by_id()の異常ケースのテスト
-    # =============================================================================
-    @pytest.mark.parametrize("todo_id, error_message", todo_error_data)
-    def test_get_todo_by_id_error_cases(
-        self,
-        get_test_session: Session,
-        todo_id: int,
-        error_message: str,
-    ) -> None:
-        """_get_todo_by_id()の異常ケースのテスト"""
-        repository = TodoRepository(get_test_session)
-
-        with pytest.raises(ValueError, match=error_message):
-            repository._get_todo_by_id(todo_id)
+    # Todoを指定して実行するメソッドの一覧。各ケースで使いまわすためにクラス変数に定義
+    todo_operations: ClassVar[list[ParameterSet]] = [
+        pytest.param(
+            lambda repository, todo_id: repository._get_todo_by_id(todo_id),
+            id="get_todo_by_id",
+        ),
+        pytest.param(
+            lambda repository, todo_id: repository.get_todo(todo_id),
+            id="get_todo",
+        ),
+        pytest.param(
+            lambda repository, todo_id: repository.update_todo(
+                todo_id, TodoUpdate(title="updated")
+            ),
+            id="update_todo",
+        ),
+        pytest.param(
+            lambda repository, todo_id: repository.update_todo(todo_id, TodoUpdate()),
+            id="update_todo_without_changes",
+        ),
+        pytest.param(
+            lambda repository, todo_id: repository.delete_todo(todo_id),
+            id="delete_todo",
+        ),
+    ]
 
     # =============================================================================
-    # get_todo()の異常ケースのテスト
+    # 存在しないTodoを指定した場合の異常ケースのテスト（メソッド毎）
     # =============================================================================
+    @pytest.mark.parametrize("operation", todo_operations)
     @pytest.mark.parametrize("todo_id, error_message", todo_error_data)
-    def test_get_todo_error_cases(
+    def test_todo_not_found_error_cases(
         self,
-        get_test_session: Session,
+        repository: TodoRepository,
+        operation: Callable[[TodoRepository, int], object],
         todo_id: int,
         error_message: str,
     ) -> None:
-        """get_todo()の異常ケースのテスト"""
-        repository = TodoRepository(get_test_session)
-
-        with pytest.raises(ValueError, match=error_message):
-            repository.get_todo(todo_id)
+        """存在しないTodoを指定した場合の異常ケースのテスト"""
+        with pytest.raises(TodoNotFoundError, match=error_message):
+            operation(repository, todo_id)
 
     # =============================================================================
-    # update_todo()の異常ケースのテスト
+    # 存在し得ないIDを指定した場合の異常ケースのテスト
     # =============================================================================
-    @pytest.mark.parametrize("todo_id, error_message", todo_error_data)
-    def test_update_todo_error_cases(
+    @pytest.mark.parametrize("operation", todo_operations)
+    @pytest.mark.parametrize(
+        "todo_id",
+        [
+            pytest.param(0, id="invalid_id"),
+            pytest.param(-1, id="negative_id"),
+        ],
+    )
+    def test_invalid_todo_id_skips_query(
         self,
-        get_test_session: Session,
+        mocker: MockerFixture,
+        operation: Callable[[TodoRepository, int], object],
         todo_id: int,
-        error_message: str,
     ) -> None:
-        """update_todo()の異常ケースのテスト"""
-        todo_update = TodoUpdate(title="updated")
-        repository = TodoRepository(get_test_session)
-
-        with pytest.raises(ValueError, match=error_message):
-            repository.update_todo(todo_id, todo_update)
+        """0以下のIDではデータベースに問い合わせずに例外が発生すること"""
+        mock_session = mocker.Mock(spec=Session)
+        repository = TodoRepository(mock_session)
 
-    # =============================================================================
-    # delete_todo()の異常ケースのテスト
-    # =============================================================================
-    @pytest.mark.parametrize("todo_id, error_message", todo_error_data)
-    def test_delete_todo_error_cases(
-        self,
-        get_test_session: Session,
-        todo_id: int,
-        error_message: str,
-    ) -> None:
-        """delete_todo()の異常ケースのテスト"""
-        # リポジトリを作成
-        repository = TodoRepository(get_test_session)
+        with pytest.raises(TodoNotFoundError, match=f"Todo with id {todo_id} not found"):
+            operation(repository, todo_id)
 
-        with pytest.raises(ValueError, match=error_message):
-            repository.delete_todo(todo_id)
+        mock_session.get.assert_not_called()
+        mock_session.exec.assert_not_called()
@@ -1,4 +1,8 @@
+from collections.abc import Generator
+from typing import Any, ClassVar
+
 import pytest
+from _pytest.mark import ParameterSet
 from fastapi import FastAPI
 from fastapi.encoders import jsonable_encoder
 from fastapi.testclient import TestClient
@@ -8,21 +12,49 @@ from sqlmodel import Session
 
 from app.infrastructure.db import get_session
 from app.models.todo import Todo, TodoCreate, TodoRead, TodoUpdate
+from app.routers.exception_handlers import register_exception_handlers
 from app.routers.todo import router
 from app.usecases.todo_usecase import TodoUsecase
 
+# 更新系のテストで事前に登録しておくTodo（複数のテストケースで共通）
+UPDATE_TARGET_TODOS = [TodoCreate(title="title", description="description", completed=False)]
+
 
-def get_test_app(session: Session) -> FastAPI:
-    """テスト用のFastAPIアプリケーションを作成"""
+@pytest.fixture(scope="module")
+def test_app() -> FastAPI:
+    """テスト用のFastAPIアプリケーションを作成（モジュール内で使い回す）"""
     app = FastAPI()
     app.include_router(router)
-
-    # データベースセッションの依存性を上書き
-    app.dependency_overrides[get_session] = lambda: session
+    register_exception_handlers(app)
 
     return app
 
 
+@pytest.fixture(scope="module")
+def test_client(test_app: FastAPI) -> Generator[TestClient, None, None]:
+    """
+    テスト用のクライアントを作成（モジュール内で使い回す）
+
+    with文で開始することで、リクエスト毎にポータル（イベントループのスレッド）を起動せず
+    モジュール内で同じイベントループを使い回します。
+    """
+    with TestClient(test_app) as client:
+        yield client
+
+
+@pytest.fixture
+def client(
+    test_app: FastAPI, test_client: TestClient, get_test_session: Session
+) -> Generator[TestClient, None, None]:
+    """テストケース毎にデータベースセッションの依存性を上書きしたクライアントを提供するFixture"""
+    test_app.dependency_overrides[get_session] = lambda: get_test_session
+
+    yield test_client
+
+    # 他のテストに影響しないよう、上書きした依存性を元に戻す
+    test_app.dependency_overrides.clear()
+
+
 # =============================================================================
 # 正常ケースのテスト
 # =============================================================================
@@ -64,15 +96,11 @@ class TestTodoRouterSuccessCases:
     )
     def test_get_todos(
         self,
-        get_test_session: Session,
+        client: TestClient,
         create_test_todo_data: list[Todo],
         expected_todo: list[TodoRead],
     ) -> None:
         """GET /todos エンドポイントのテスト"""
-        # テスト用アプリケーションを作成
-        app = get_test_app(get_test_session)
-        client = TestClient(app)
-
         # APIを呼び出し
         response = client.get("/todos")
 
@@ -109,14 +137,11 @@ class TestTodoRouterSuccessCases:
     def test_get_todo(
         self,
         todo_id: int,
-        get_test_session: Session,
+        client: TestClient,
         create_test_todo_data: list[Todo],
         expected_todo: TodoRead,
     ) -> None:
         """GET /todos/{todo_id} エンドポイントのテスト"""
-        app = get_test_app(get_test_session)
-        client = TestClient(app)
-
         # APIを呼び出し
         response = client.get(f"/todos/{todo_id}")
 
@@ -144,14 +169,11 @@ class TestTodoRouterSuccessCases:
     )
     def test_create_todo(
         self,
-        get_test_session: Session,
+        client: TestClient,
         todo_create: TodoCreate,
         expected_todo: TodoRead,
     ) -> None:
         """POST /todos エンドポイントのテスト"""
-        app = get_test_app(get_test_session)
-        client = TestClient(app)
-
         # APIを呼び出し
         response = client.post("/todos", json=jsonable_encoder(todo_create))
 
@@ -168,7 +190,7 @@ class TestTodoRouterSuccessCases:
             # タイトルのみ更新
             pytest.param(
                 1,
-                [TodoCreate(title="title", description="description", completed=False)],
+                UPDATE_TARGET_TODOS,
                 TodoUpdate(title="updated"),
                 TodoRead(id=1, title="updated", description="description", completed=False),
                 id="update_todo_title",
@@ -176,7 +198,7 @@ class TestTodoRouterSuccessCases:
             # 説明のみ更新
             pytest.param(
                 1,
-                [TodoCreate(title="title", description="description", completed=False)],
+                UPDATE_TARGET_TODOS,
                 TodoUpdate(description="updated"),
                 TodoRead(id=1, title="title", description="updated", completed=False),
                 id="update_todo_description",
@@ -184,7 +206,7 @@ class TestTodoRouterSuccessCases:
             # 完了状態のみ更新
             pytest.param(
                 1,
-                [TodoCreate(title="title", description="description", completed=False)],
+                UPDATE_TARGET_TODOS,
                 TodoUpdate(completed=True),
                 TodoRead(id=1, title="title", description="description", completed=True),
                 id="update_todo_completed",
@@ -192,7 +214,7 @@ class TestTodoRouterSuccessCases:
             # 全フィールドの更新
             pytest.param(
                 1,
-                [TodoCreate(title="title", description="description", completed=False)],
+                UPDATE_TARGET_TODOS,
                 TodoUpdate(title="updated", description="updated", completed=True),
                 TodoRead(id=1, title="updated", description="updated", completed=True),
                 id="update_todo_all_fields",
@@ -202,14 +224,12 @@ class TestTodoRouterSuccessCases:
     )
     def test_update_todo(
         self,
-        get_test_session: Session,
+        client: TestClient,
         todo_id: int,
         create_test_todo_data: list[Todo],
         todo_update: TodoUpdate,
         expected_todo: TodoRead,
     ) -> None:
-        app = get_test_app(get_test_session)
-        client = TestClient(app)
         # APIを呼び出し（exclude_unset=Trueを使用してNone値を除外）
         response = client.put(f"/todos/{todo_id}", json=todo_update.model_dump(exclude_unset=True))
 
@@ -241,13 +261,10 @@ class TestTodoRouterSuccessCases:
     )
     def test_delete_todo(
         self,
-        get_test_session: Session,
+        client: TestClient,
         todo_id: int,
         create_test_todo_data: list[Todo],
     ) -> None:
-        app = get_test_app(get_test_session)
-        client = TestClient(app)
-
         # APIを呼び出し
         response = client.delete(f"/todos/{todo_id}")
 
@@ -261,87 +278,44 @@ class TestTodoRouterErrorCases:
     # 異常ケースのテスト
     # =============================================================================
 
-    # =============================================================================
-    # GET /todos/{todo_id} エンドポイントの404エラーケースのテスト
-    # =============================================================================
-    @pytest.mark.parametrize(
-        "todo_id, expected_error_message",
-        [
-            pytest.param(999, "Todo with id 999 not found", id="not_found"),
-            pytest.param(0, "Todo with id 0 not found", id="invalid_id"),
-            pytest.param(-1, "Todo with id -1 not found", id="negative_id"),
-        ],
-    )
-    def test_get_todo_not_found(
-        self,
-        get_test_session: Session,
-        todo_id: int,
-        expected_error_message: str,
-    ) -> None:
-        """GET /todos/{todo_id} エンドポイントの404エラーテスト"""
-        app = get_test_app(get_test_session)
-        client = TestClient(app)
-
-        # APIを呼び出し
-        response = client.get(f"/todos/{todo_id}")
-
-        # 結果を検証
-        assert response.status_code == 404
-        assert response.json() == {"detail": expected_error_message}
-
-    # =============================================================================
-    # PUT /todos/{todo_id} エンドポイントの404エラーケースのテスト
-    # =============================================================================
-    @pytest.mark.parametrize(
-        "todo_id, expected_error_message",
-        [
-            pytest.param(999, "Todo with id 999 not found", id="not_found"),
-            pytest.param(0, "Todo with id 0 not found", id="invalid_id"),
-            pytest.param(-1, "Todo with id -1 not found", id="negative_id"),
-        ],
-    )
-    def test_update_todo_not_found(
-        self,
-        get_test_session: Session,
-        todo_id: int,
-        expected_error_message: str,
-    ) -> None:
-        """PUT /todos/{todo_id} エンドポイントの404エラーテスト"""
-        app = get_test_app(get_test_session)
-        client = TestClient(app)
-
-        # APIを呼び出し
-        response = client.put(
-            f"/todos/{todo_id}", json=TodoUpdate(title="updated").model_dump(exclude_unset=True)
-        )
-
-        # 結果を検証
-        assert response.status_code == 404
-        assert response.json() == {"detail": expected_error_message}
+    # 存在しないTodoを指定した場合のデータ
+    todo_not_found_data: ClassVar[list[ParameterSet]] = [
+        pytest.param(999, "Todo with id 999 not found", id="not_found"),
+        pytest.param(0, "Todo with id 0 not found", id="invalid_id"),
+        pytest.param(-1, "Todo with id -1 not found", id="negative_id"),
+    ]
+
+    # 異常ケースで送信するリクエストボディ。テスト毎に組み立てずクラス変数に定義
+    create_request_body: ClassVar[dict[str, Any]] = {
+        "title": "test",
+        "description": "test",
+        "completed": False,
+    }
+    update_request_body: ClassVar[dict[str, Any]] = {"title": "updated"}
 
     # =============================================================================
-    # DELETE /todos/{todo_id} エンドポイントの404エラーケースのテスト
+    # GET/PUT/DELETE /todos/{todo_id} エンドポイントの404エラーケースのテスト
     # =============================================================================
     @pytest.mark.parametrize(
-        "todo_id, expected_error_message",
+        "method, request_body",
         [
-            pytest.param(999, "Todo with id 999 not found", id="not_found"),
-            pytest.param(0, "Todo with id 0 not found", id="invalid_id"),
-            pytest.param(-1, "Todo with id -1 not found", id="negative_id"),
+            pytest.param("GET", None, id="get_todo"),
+            pytest.param("PUT", update_request_body, id="update_todo"),
+            pytest.param("DELETE", None, id="delete_todo"),
         ],
     )
-    def test_delete_todo_not_found(
+    @pytest.mark.parametrize("todo_id, expected_error_message", todo_not_found_data)
+    def test_todo_not_found(
         self,
-        get_test_session: Session,
+        client: TestClient,
+        method: str,
+        request_body: dict[str, Any] | None,
         todo_id: int,
         expected_error_message: str,
     ) -> None:
-        """DELETE /todos/{todo_id} エンドポイントの404エラーテスト"""
-        app = get_test_app(get_test_session)
-        client = TestClient(app)
-
+        """/todos/{todo_id} エンドポイントの404エラーテスト（HTTPメソッド毎）"""
         # APIを呼び出し
-        response = client.delete(f"/todos/{todo_id}")
+        response = client.request(method, f"/todos/{todo_id}", json=request_body)
 
         # 結果を検証
         assert response.status_code == 404
@@ -356,7 +330,7 @@ class TestTodoRouterErrorCases:
             # 明示的にNone値を送信（タイトル）
             pytest.param(
                 1,
-                [TodoCreate(title="title", description="description", completed=False)],
+                UPDATE_TARGET_TODOS,
                 {"title": None},
                 "title cannot be null",
                 id="explicit_none_title",
@@ -364,7 +338,7 @@ class TestTodoRouterErrorCases:
             # 明示的にNone値を送信（説明）
             pytest.param(
                 1,
-                [TodoCreate(title="title", description="description", completed=False)],
+                UPDATE_TARGET_TODOS,
                 {"description": None},
                 "description cannot be null",
                 id="explicit_none_description",
@@ -372,7 +346,7 @@ class TestTodoRouterErrorCases:
             # 空文字列（タイトル）
             pytest.param(
                 1,
-                [TodoCreate(title="title", description="description", completed=False)],
+                UPDATE_TARGET_TODOS,
                 {"title": ""},
                 "title is required",
                 id="empty_string_title",
@@ -380,7 +354,7 @@ class TestTodoRouterErrorCases:
             # 空文字列（説明）
             pytest.param(
                 1,
-                [TodoCreate(title="title", description="description", completed=False)],
+                UPDATE_TARGET_TODOS,
                 {"description": ""},
                 "description is required",
                 id="empty_string_description",
@@ -388,7 +362,7 @@ class TestTodoRouterErrorCases:
             # 空白のみ（タイトル）
             pytest.param(
                 1,
-                [TodoCreate(title="title", description="description", completed=False)],
+                UPDATE_TARGET_TODOS,
                 {"title": "   "},
                 "title is required",
                 id="whitespace_only_title",
@@ -396,7 +370,7 @@ class TestTodoRouterErrorCases:
             # 空白のみ（説明）
             pytest.param(
                 1,
-                [TodoCreate(title="title", description="description", completed=False)],
+                UPDATE_TARGET_TODOS,
                 {"description": "   "},
                 "description is required",
                 id="whitespace_only_description",
@@ -404,7 +378,7 @@ class TestTodoRouterErrorCases:
             # 混在するケース（有効な値とNone値）
             pytest.param(
                 1,
-                [TodoCreate(title="title", description="description", completed=False)],
+                UPDATE_TARGET_TODOS,
                 {"title": "updated", "description": None},
                 "description cannot be null",
                 id="mixed_valid_and_none",
@@ -414,16 +388,13 @@ class TestTodoRouterErrorCases:
     )
     def test_update_todo_validation_errors(
         self,
-        get_test_session: Session,
+        client: TestClient,
         todo_id: int,
         create_test_todo_data: list[Todo],
         update_data: dict[str, str | None],
         expected_error_message: str,
     ) -> None:
         """PUT /todos/{todo_id} エンドポイントのバリデーションエラーテスト"""
-        app = get_test_app(get_test_session)
-        client = TestClient(app)
-
         # APIを呼び出し
         response = client.put(f"/todos/{todo_id}", json=update_data)
 
@@ -438,7 +409,8 @@ class TestTodoRouterErrorCases:
     # =============================================================================
     def test_create_todo_integrity_error(
         self,
-        get_test_session: Session,
+        test_app: FastAPI,
+        client: TestClient,
         mocker: MockerFixture,
     ) -> None:
         """POST /todos エンドポイントのIntegrityErrorテスト"""
@@ -448,14 +420,11 @@ class TestTodoRouterErrorCases:
             "INSERT statement failed", "params", orig=Exception("Original error")
         )
 
-        # アプリケーションを作成し、依存関係を上書き
-        app = get_test_app(get_test_session)
-        app.dependency_overrides[TodoUsecase] = lambda: mock_usecase
-        client = TestClient(app)
+        # 依存関係を上書き
+        test_app.dependency_overrides[TodoUsecase] = lambda: mock_usecase
 
         # APIを呼び出し
-        todo_create = TodoCreate(title="test", description="test", completed=False)
-        response = client.post("/todos", json=jsonable_encoder(todo_create))
+        response = client.post("/todos", json=self.create_request_body)
 
         # 結果を検証
         assert response.status_code == 400
@@ -468,7 +437,8 @@ class TestTodoRouterErrorCases:
     # =============================================================================
     def test_update_todo_integrity_error(
         self,
-        get_test_session: Session,
+        test_app: FastAPI,
+        client: TestClient,
         mocker: MockerFixture,
     ) -> None:
         """PUT /todos/{todo_id} エンドポイントのIntegrityErrorテスト"""
@@ -478,19 +448,70 @@ class TestTodoRouterErrorCases:
             "UPDATE statement failed", "params", orig=Exception("Original error")
         )
 
-        # アプリケーションを作成し、依存関係を上書き
-        app = get_test_app(get_test_session)
-        app.dependency_overrides[TodoUsecase] = lambda: mock_usecase
-        client = TestClient(app)
+        # 依存関係を上書き
+        test_app.dependency_overrides[TodoUsecase] = lambda: mock_usecase
 
         # APIを呼び出し
-        todo_update = TodoUpdate(title="updated")
-        response = client.put(
-            "/todos/1", json=jsonable_encoder(todo_update.model_dump(exclude_unset=True))
-        )
+        response = client.put("/todos/1", json=self.update_request_body)
 
         # 結果を検証
         assert response.status_code == 400
         assert response.json() == {
             "detail": "Failed to update todo due to data constraint violation"
         }
+
+    # =============================================================================
+    # DELETE /todos/{todo_id} エンドポイントのIntegrityErrorケースのテスト
+    # =============================================================================
+    def test_delete_todo_integrity_error(
+        self,
+        test_app: FastAPI,
+        client: TestClient,
+        mocker: MockerFixture,
+    ) -> None:
+        """DELETE /todos/{todo_id} エンドポイントのIntegrityErrorテスト"""
+        # モックのTodoUsecaseを作成
+        mock_usecase = mocker.Mock(spec=TodoUsecase)
+        mock_usecase.delete_todo.side_effect = IntegrityError(
+            "DELETE statement failed", "params", orig=Exception("Original error")
+        )
+
+        # 依存関係を上書き
+        test_app.dependency_overrides[TodoUsecase] = lambda: mock_usecase
+
+        # APIを呼び出し
+        response = client.delete("/todos/1")
+
+        # 結果を検証
+        assert response.status_code == 400
+        assert response.json() == {
+            "detail": "Failed to delete todo due to data constraint violation"
+        }
+
+    # =============================================================================
+    # 操作名の対応がないHTTPメソッドのIntegrityErrorケースのテスト
+    # =============================================================================
+    def test_get_todo_integrity_error(
+        self,
+        test_app: FastAPI,
+        client: TestClient,
+        mocker: MockerFixture,
+    ) -> None:
+        """GET /todos/{todo_id} エンドポイントのIntegrityErrorテスト（操作名は"process"）"""
+        # モックのTodoUsecaseを作成
+        mock_usecase = mocker.Mock(spec=TodoUsecase)
+        mock_usecase.get_todo.side_effect = IntegrityError(
+            "SELECT statement failed", "params", orig=Exception("Original error")
+        )
+
+        # 依存関係を上書き
+        test_app.dependency_overrides[TodoUsecase] = lambda: mock_usecase
+
+        # APIを呼び出し
+        response = client.get("/todos/1")
+
+        # 結果を検証
+        assert response.status_code == 400
+        assert response.json() == {
+            "detail": "Failed to process todo due to data constraint violation"
+        }
@@ -0,0 +1,102 @@
+import threading
+from unittest.mock import MagicMock
+
+import anyio
+import pytest
+from anyio import to_thread
+from fastapi.testclient import TestClient
+from pytest_mock import MockerFixture
+from sqlalchemy.exc import OperationalError
+
+from app.infrastructure.db import get_connection_pool_capacity
+from app.main import app
+
+
+async def _get_default_total_tokens() -> int:
+    """新しいイベントループにおけるスレッドプールの既定の同時実行数を取得する"""
+    return to_thread.current_default_thread_limiter().total_tokens
+
+
+class TestLifespan:
+    """lifespan()のテスト"""
+
+    @pytest.fixture
+    def mock_warm_up(self, mocker: MockerFixture) -> MagicMock:
+        """コネクションプールの事前接続をモック化するFixture"""
+        return mocker.patch("app.main.warm_up_connection_pool")
+
+    @pytest.fixture
+    def mock_engine(self, mocker: MockerFixture) -> MagicMock:
+        """lifespanから参照するデータベースエンジンをモック化するFixture"""
+        mock = mocker.MagicMock()
+        mocker.patch("app.main.get_database_engine", return_value=mock)
+        return mock
+
+    @pytest.mark.parametrize(
+        "pool_size, max_overflow",
+        [
+            # プールの上限が既定の同時実行数を上回る場合は引き上げる
+            pytest.param("50", "10", id="raise_thread_limit"),
+            # プールの上限が既定の同時実行数を下回る場合は既定値のまま
+            pytest.param("5", "5", id="keep_default_thread_limit"),
+        ],
+    )
+    def test_thread_limiter_total_tokens(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        mock_warm_up: MagicMock,
+        mock_engine: MagicMock,
+        pool_size: str,
+        max_overflow: str,
+    ) -> None:
+        """スレッドプールの同時実行数がプールの上限まで引き上げられ、引き下げられないこと"""
+        monkeypatch.setenv("POSTGRES_POOL_SIZE", pool_size)
+        monkeypatch.setenv("POSTGRES_MAX_OVERFLOW", max_overflow)
+        default_total_tokens = anyio.run(_get_default_total_tokens)
+
+        with TestClient(app) as client:
+            # lifespanが動作しているイベントループのスレッドプール設定を取得
+            limiter = client.portal.call(to_thread.current_default_thread_limiter)
+
+            assert limiter.total_tokens == max(default_total_tokens, get_connection_pool_capacity())
+            assert limiter.total_tokens >= default_total_tokens
+
+    def test_warm_up_called_once(self, mock_warm_up: MagicMock, mock_engine: MagicMock) -> None:
+        """起動時にコネクションプールの事前接続が一度だけ行われること"""
+        with TestClient(app):
+            mock_warm_up.assert_called_once_with()
+
+    def test_engine_disposed_on_shutdown(
+        self, mock_warm_up: MagicMock, mock_engine: MagicMock
+    ) -> None:
+        """終了時にエンジンのコネクションが解放されること"""
+        with TestClient(app):
+            # 起動中は解放されないこと
+            mock_engine.dispose.assert_not_called()
+
+        mock_engine.dispose.assert_called_once_with()
+
+    def test_warm_up_runs_in_worker_thread(
+        self, mock_warm_up: MagicMock, mock_engine: MagicMock
+    ) -> None:
+        """ブロッキング処理である事前接続が、イベントループ外のスレッドで実行されること"""
+        warm_up_threads: list[threading.Thread] = []
+        mock_warm_up.side_effect = lambda: warm_up_threads.append(threading.current_thread())
+
+        with TestClient(app) as client:
+            event_loop_thread = client.portal.call(threading.current_thread)
+
+        assert len(warm_up_threads) == 1
+        assert warm_up_threads[0] is not event_loop_thread
+
+    def test_startup_fails_when_database_unreachable(
+        self, mock_warm_up: MagicMock, mock_engine: MagicMock
+    ) -> None:
+        """データベースに接続できない場合は起動時に失敗すること"""
+        mock_warm_up.side_effect = OperationalError("SELECT 1", {}, Exception("connection refused"))
+
+        with pytest.raises(OperationalError), TestClient(app):
+            pass
+
+        # 起動に失敗した場合は終了処理まで到達しない
+        mock_engine.dispose.assert_not_called()
@@ -1,4 +1,5 @@
 import pytest
+from _pytest.mark import ParameterSet
 from pytest_mock import MockerFixture
 
 from app.models.todo import TodoCreate, TodoRead, TodoUpdate
@@ -13,17 +14,23 @@ from app.usecases.todo_usecase import TodoUsecase
 # get_todos()の正常ケースのテスト
 # =============================================================================
 # get_todos()の正常ケースのテスト用データ
-todos_data: list[list[TodoRead]] = [
+todos_data: list[ParameterSet] = [
     # 空のリスト
-    [],
+    pytest.param([], id="no_todos"),
     # 単一のTodo
-    [TodoRead(id=1, title="test", description="test", completed=False)],
+    pytest.param(
+        [TodoRead(id=1, title="test", description="test", completed=False)],
+        id="one_todo",
+    ),
     # 複数のTodo
-    [
-        TodoRead(id=1, title="task1", description="desc1", completed=False),
-        TodoRead(id=2, title="task2", description="desc2", completed=True),
-        TodoRead(id=3, title="task3", description="desc3", completed=False),
-    ],
+    pytest.param(
+        [
+            TodoRead(id=1, title="task1", description="desc1", completed=False),
+            TodoRead(id=2, title="task2", description="desc2", completed=True),
+            TodoRead(id=3, title="task3", description="desc3", completed=False),
+        ],
+        id="multiple_todos",
+    ),
 ]
 
 
@@ -50,9 +57,17 @@ def test_get_todos_success_cases(
 # get_todo()の正常ケースのテスト
 # =============================================================================
 # get_todo()の正常ケースのテスト用データ
-get_todo_success_data: list[tuple[int, TodoRead]] = [
-    (1, TodoRead(id=1, title="test", description="test", completed=False)),
-    (999, TodoRead(id=999, title="important", description="urgent task", completed=True)),
+get_todo_success_data: list[ParameterSet] = [
+    pytest.param(
+        1,
+        TodoRead(id=1, title="test", description="test", completed=False),
+        id="get_todo",
+    ),
+    pytest.param(
+        999,
+        TodoRead(id=999, title="important", description="urgent task", completed=True),
+        id="get_todo_completed",
+    ),
 ]
 
 
@@ -80,18 +95,21 @@ def test_get_todo_success_cases(
 # create_todo()の正常ケースのテスト
 # =============================================================================
 # create_todo()の正常ケースのテスト用データ
-create_todo_success_data: list[tuple[TodoCreate, TodoRead]] = [
-    (
+create_todo_success_data: list[ParameterSet] = [
+    pytest.param(
         TodoCreate(title="new task", description="new description"),
         TodoRead(id=1, title="new task", description="new description", completed=False),
+        id="create_todo_default_completed",
     ),
-    (
+    pytest.param(
         TodoCreate(title="new task", description="new description", completed=False),
         TodoRead(id=1, title="new task", description="new description", completed=False),
+        id="create_todo",
     ),
-    (
+    pytest.param(
         TodoCreate(title="urgent", description="do it now", completed=True),
         TodoRead(id=2, title="urgent", description="do it now", completed=True),
+        id="create_todo_completed",
     ),
 ]
 
@@ -122,16 +140,18 @@ def test_create_todo_success_cases(
 # update_todo()の正常ケースのテスト用データ
 
 
-update_todo_success_data: list[tuple[int, TodoUpdate, TodoRead]] = [
-    (
+update_todo_success_data: list[ParameterSet] = [
+    pytest.param(
         1,
         TodoUpdate(title="updated"),
         TodoRead(id=1, title="updated", description="old desc", completed=False),
+        id="update_todo_title",
     ),
-    (
+    pytest.param(
         2,
         TodoUpdate(completed=True),
         TodoRead(id=2, title="old title", description="old desc", completed=True),
+        id="update_todo_completed",
     ),
 ]
 
@@ -163,7 +183,10 @@ def test_update_todo_success_cases(
 # delete_todo()の正常ケースのテスト用データ
 
 
-delete_todo_success_data: list[int] = [1, 999]
+delete_todo_success_data: list[ParameterSet] = [
+    pytest.param(1, id="delete_todo"),
+    pytest.param(999, id="delete_todo_large_id"),
+]
 
 
 @pytest.mark.parametrize("todo_id", delete_todo_success_data)
@@ -193,10 +216,10 @@ def test_delete_todo_success_cases(mocker: MockerFixture, todo_id: int) -> None:
 # get_todo()の異常ケースのテスト用データ
 
 
-get_todo_error_data: list[tuple[int, str]] = [
-    (999, "Todo not found"),
-    (0, "Invalid ID"),
-    (-1, "Negative ID not allowed"),
+get_todo_error_data: list[ParameterSet] = [
+    pytest.param(999, "Todo not found", id="not_found"),
+    pytest.param(0, "Invalid ID", id="invalid_id"),
+    pytest.param(-1, "Negative ID not allowed", id="negative_id"),
 ]
 
 
@@ -225,10 +248,10 @@ def test_get_todo_error_cases(
 # update_todo()の異常ケースのテスト用データ
 
 
-update_todo_error_data: list[tuple[int, TodoUpdate, str]] = [
-    (999, TodoUpdate(title="updated"), "Todo not found"),
-    (0, TodoUpdate(completed=True), "Invalid ID"),
-    (-1, TodoUpdate(title="test"), "Negative ID not allowed"),
+update_todo_error_data: list[ParameterSet] = [
+    pytest.param(999, TodoUpdate(title="updated"), "Todo not found", id="not_found"),
+    pytest.param(0, TodoUpdate(completed=True), "Invalid ID", id="invalid_id"),
+    pytest.param(-1, TodoUpdate(title="test"), "Negative ID not allowed", id="negative_id"),
 ]
 
 
@@ -259,10 +282,10 @@ def test_update_todo_error_cases(
 # delete_todo()の異常ケースのテスト用データ
 
 
-delete_todo_error_data: list[tuple[int, str]] = [
-    (999, "Todo not found"),
-    (0, "Invalid ID"),
-    (-1, "Negative ID not allowed"),
+delete_todo_error_data: list[ParameterSet] = [
+    pytest.param(999, "Todo not found", id="not_found"),
+    pytest.param(0, "Invalid ID", id="invalid_id"),
+    pytest.param(-1, "Negative ID not allowed", id="negative_id"),
 ]
 
 
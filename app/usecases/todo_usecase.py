@@ -67,7 +67,7 @@ class TodoUsecase:
             TodoRead: 指定されたTodoアイテム。
 
         Raises:
-            ValueError: 指定されたIDのTodoが見つからない場合
+            TodoNotFoundError: 指定されたIDのTodoが見つからない場合
             データベースアクセスエラーなどの例外が発生する可能性があります。
         """
         return self.todo_repository.get_todo(todo_id)
@@ -103,7 +103,7 @@ class TodoUsecase:
             TodoRead: 更新されたTodoアイテム。
 
         Raises:
-            ValueError: 指定されたIDのTodoが見つからない場合
+            TodoNotFoundError: 指定されたIDのTodoが見つからない場合
             データベースアクセスエラーなどの例外が発生する可能性があります。
         """
         return self.todo_repository.update_todo(todo_id, todo_update)
@@ -120,7 +120,7 @@ class TodoUsecase:
             bool: 削除が成功した場合True
 
         Raises:
-            ValueError: 指定されたIDのTodoが見つからない場合
+            TodoNotFoundError: 指定されたIDのTodoが見つからない場合
             データベースアクセスエラーなどの例外が発生する可能性があります。
         """
         return self.todo_repository.delete_todo(todo_id)